@@ -0,0 +1,381 @@
+#include <Python.h>
+#include <fcntl.h>
+
+/* FastCDC content-defined chunker
+
+https://www.usenix.org/conference/atc16/technical-sessions/presentation/xia
+
+FastCDC replaces the byte-wise rolling hash window of buzhash with a Gear
+hash: h = (h << 1) + GEAR[byte]. As every table entry is a full random
+64 bit value, a single table lookup and add per input byte is enough, there
+is no "remove old byte" operation and no hash window to maintain.
+
+Chunk size normalization: before the target (avg) chunk size is reached, a
+stricter mask (more bits) is used, making an early cut unlikely; after the
+avg size, a looser mask (fewer bits) is used, making a late cut likely.
+Together with the cut-point skipping over the first min_size bytes, this
+concentrates the chunk size distribution around avg_size.
+
+The first min_size bytes of every chunk are never even hashed, so roughly
+a quarter of the input (for the default parameters) is skipped entirely.
+
+As with the buzhash chunker, the gear table is seeded per repository to
+avoid chunk size fingerprinting attacks.
+*/
+
+#define FASTCDC_NORM_BITS 2  /* chunk size normalization level (bits added to / removed from the masks) */
+
+static size_t fastcdc_pagemask;
+
+/* splitmix64 is used to derive the 256 gear table entries from the seed */
+static uint64_t
+fastcdc_mix(uint64_t *state)
+{
+    uint64_t z = (*state += 0x9e3779b97f4a7c15ull);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ull;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebull;
+    return z ^ (z >> 31);
+}
+
+static uint64_t *
+fastcdc_init_table(uint32_t seed)
+{
+    int i;
+    uint64_t state = seed;
+    uint64_t *table = malloc(256 * sizeof(uint64_t));
+    if(table == NULL) {
+        return NULL;
+    }
+    for(i = 0; i < 256; i++) {
+        table[i] = fastcdc_mix(&state);
+    }
+    return table;
+}
+
+typedef struct {
+    uint64_t *table;
+    uint64_t mask_s, mask_l;  /* strict mask (before avg_size), loose mask (after avg_size) */
+    uint8_t *data;
+    PyObject *fd;
+    int fh;
+    int done, eof;
+    size_t min_size, avg_size, buf_size, remaining, position, last;
+    off_t bytes_read, bytes_yielded;
+} FastCDC;
+
+static void fastcdc_init_search(void);
+
+/* top anchored mask with <bits> one-bits. with h = (h << 1) + g, the high
+ * hash bits accumulate the influence of the most input bytes, thus we put
+ * the mask bits there. */
+static uint64_t
+fastcdc_mask(int bits)
+{
+    if(bits <= 0)
+        return 0;
+    if(bits >= 64)
+        return ~(uint64_t)0;
+    return ~(((uint64_t)1 << (64 - bits)) - 1);
+}
+
+static FastCDC *
+fastcdc_init(size_t min_size, size_t avg_size, size_t max_size, int mask_bits, uint32_t seed)
+{
+    FastCDC *c = calloc(sizeof(FastCDC), 1);
+    fastcdc_init_search();
+    c->min_size = min_size;
+    c->avg_size = avg_size;
+    c->mask_s = fastcdc_mask(mask_bits + FASTCDC_NORM_BITS);
+    c->mask_l = fastcdc_mask(mask_bits - FASTCDC_NORM_BITS);
+    c->table = fastcdc_init_table(seed);
+    /* the buffer must be able to hold a max_size chunk, this also naturally
+     * enforces the maximum chunk size in fastcdc_scan. */
+    c->buf_size = max_size;
+    c->data = malloc(c->buf_size);
+    c->fh = -1;
+    return c;
+}
+
+static void
+fastcdc_set_fd(FastCDC *c, PyObject *fd, int fh)
+{
+    Py_XDECREF(c->fd);
+    c->fd = fd;
+    Py_INCREF(fd);
+    c->fh = fh;
+    c->done = 0;
+    c->remaining = 0;
+    c->bytes_read = 0;
+    c->bytes_yielded = 0;
+    c->position = 0;
+    c->last = 0;
+    c->eof = 0;
+}
+
+static void
+fastcdc_free(FastCDC *c)
+{
+    Py_XDECREF(c->fd);
+    free(c->table);
+    free(c->data);
+    free(c);
+}
+
+static int
+fastcdc_fill(FastCDC *c)
+{
+    ssize_t n;
+    PyObject *data;
+    PyThreadState *thread_state;
+
+    memmove(c->data, c->data + c->last, c->position + c->remaining - c->last);
+    c->position -= c->last;
+    c->last = 0;
+    n = c->buf_size - c->position - c->remaining;
+    if(c->eof || n == 0) {
+        return 1;
+    }
+    if(c->fh >= 0) {
+        thread_state = PyEval_SaveThread();
+
+        #if ( ( _XOPEN_SOURCE >= 600 || _POSIX_C_SOURCE >= 200112L ) && defined(POSIX_FADV_DONTNEED) )
+        off_t offset = c->bytes_read;
+        #endif
+
+        // if we have a os-level file descriptor, use os-level API
+        n = read(c->fh, c->data + c->position + c->remaining, n);
+        if(n > 0) {
+            c->remaining += n;
+            c->bytes_read += n;
+        }
+        else
+        if(n == 0) {
+            c->eof = 1;
+        }
+        else {
+            PyEval_RestoreThread(thread_state);
+            // some error happened
+            PyErr_SetFromErrno(PyExc_OSError);
+            return 0;
+        }
+        #if ( ( _XOPEN_SOURCE >= 600 || _POSIX_C_SOURCE >= 200112L ) && defined(POSIX_FADV_DONTNEED) )
+        off_t length = c->bytes_read - offset;
+
+        // Only do it once per run.
+        if (fastcdc_pagemask == 0)
+            fastcdc_pagemask = getpagesize() - 1;
+
+        // We tell the OS that we do not need the data that we just have read any
+        // more (that it maybe has in the cache). This avoids that we spoil the
+        // complete cache with data that we only read once and (due to cache
+        // size limit) kick out data from the cache that might be still useful
+        // for the OS or other processes.
+        // We rollback the initial offset back to the start of the page,
+        // to avoid it not being truncated as a partial page request.
+        int overshoot;
+        if (length > 0) {
+            // All Linux kernels (at least up to and including 4.6(.0)) have a bug where
+            // they truncate last partial page of POSIX_FADV_DONTNEED request, so we need
+            // to page-align it ourselves. We'll need the rest of this page on the next
+            // read (assuming this was not EOF).
+            overshoot = (offset + length) & fastcdc_pagemask;
+        } else {
+            // For length == 0 we set overshoot 0, so the below
+            // length - overshoot is 0, which means till end of file for
+            // fadvise. This will cancel the final page and is not part
+            // of the above workaround.
+            overshoot = 0;
+        }
+
+        posix_fadvise(c->fh, offset & ~fastcdc_pagemask, length - overshoot, POSIX_FADV_DONTNEED);
+        #endif
+
+        PyEval_RestoreThread(thread_state);
+    }
+    else {
+        // no os-level file descriptor, use Python file object API
+        data = PyObject_CallMethod(c->fd, "read", "i", n);
+        if(!data) {
+            return 0;
+        }
+        n = PyBytes_Size(data);
+        if(PyErr_Occurred()) {
+            // we wanted bytes(), but got something else
+            return 0;
+        }
+        if(n) {
+            memcpy(c->data + c->position + c->remaining, PyBytes_AsString(data), n);
+            c->remaining += n;
+            c->bytes_read += n;
+        }
+        else {
+            c->eof = 1;
+        }
+        Py_DECREF(data);
+    }
+    return 1;
+}
+
+/* search p[i..end) for a cut point with the given mask, continuing the gear
+ * hash in *h. return the index of the boundary byte (the chunk then ends
+ * after it) or <end> if there is none. */
+static size_t
+fastcdc_search_plain(const uint64_t *table, const uint8_t *p, size_t i, size_t end, uint64_t mask, uint64_t *h)
+{
+    uint64_t hh = *h;
+
+    for(; i < end; i++) {
+        hh = (hh << 1) + table[p[i]];
+        if(!(hh & mask)) {
+            *h = hh;
+            return i;
+        }
+    }
+    *h = hh;
+    return end;
+}
+
+/* On x86-64, gcc and clang can compile the AVX2 code below into a stock build
+ * (no -mavx2 / -march needed) via the target attribute; whether to use it is
+ * decided once at runtime from cpuid. Other architectures and compilers use
+ * the scalar code only. */
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define FASTCDC_HAVE_AVX2 1
+#endif
+
+#ifdef FASTCDC_HAVE_AVX2
+
+#include <immintrin.h>
+
+/* SIMD version of fastcdc_search_plain, cutting at exactly the same places.
+ *
+ * The gear hash recurrence h_i = (h_{i-1} << 1) + G[b_i] looks inherently
+ * serial, but can be unrolled: starting from h, the hash after k more bytes is
+ *     h_k = (h << k) + sum_{j=1..k} G[b_j] << (k-j)
+ * so 8 candidate boundary bytes can be tested at once: gather the 8 table
+ * values into two 4 x 64 bit registers, build the shifted prefix sums with
+ * two Hillis-Steele steps per register, add the shifted previous hash and
+ * test all lanes for (h_k & mask) == 0 in parallel. */
+__attribute__((target("avx2")))
+static size_t
+fastcdc_search_avx2(const uint64_t *table, const uint8_t *p, size_t i, size_t end, uint64_t mask, uint64_t *h)
+{
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i vmask = _mm256_set1_epi64x(mask);
+    const __m256i sh1234 = _mm256_set_epi64x(4, 3, 2, 1);
+    const __m256i sh5678 = _mm256_set_epi64x(8, 7, 6, 5);
+    uint64_t hh = *h;
+    uint64_t w;
+    int m;
+
+    while(i + 8 <= end) {
+        memcpy(&w, p + i, 8);
+        __m128i bytes = _mm_cvtsi64_si128(w);
+        /* gather the gear table values for bytes 1..4 and 5..8 */
+        __m256i g1 = _mm256_i32gather_epi64((const long long *)table, _mm_cvtepu8_epi32(bytes), 8);
+        __m256i g2 = _mm256_i32gather_epi64((const long long *)table, _mm_cvtepu8_epi32(_mm_srli_si128(bytes, 4)), 8);
+        /* shifted prefix sums: s_k = sum_{j=1..k} G[b_j] << (k-j) */
+        __m256i t = _mm256_blend_epi32(_mm256_permute4x64_epi64(g1, _MM_SHUFFLE(2, 1, 0, 0)), zero, 0x03);
+        __m256i s1 = _mm256_add_epi64(g1, _mm256_slli_epi64(t, 1));
+        t = _mm256_blend_epi32(_mm256_permute4x64_epi64(s1, _MM_SHUFFLE(1, 0, 0, 0)), zero, 0x0f);
+        s1 = _mm256_add_epi64(s1, _mm256_slli_epi64(t, 2));
+        t = _mm256_blend_epi32(_mm256_permute4x64_epi64(g2, _MM_SHUFFLE(2, 1, 0, 0)), zero, 0x03);
+        __m256i s2 = _mm256_add_epi64(g2, _mm256_slli_epi64(t, 1));
+        t = _mm256_blend_epi32(_mm256_permute4x64_epi64(s2, _MM_SHUFFLE(1, 0, 0, 0)), zero, 0x0f);
+        s2 = _mm256_add_epi64(s2, _mm256_slli_epi64(t, 2));
+        /* continue the prefix of the second register after s_4 */
+        s2 = _mm256_add_epi64(s2, _mm256_sllv_epi64(_mm256_set1_epi64x(_mm256_extract_epi64(s1, 3)), sh1234));
+        /* candidate hashes h_1..h_8 = (h << k) + s_k */
+        __m256i hv = _mm256_set1_epi64x(hh);
+        __m256i h1 = _mm256_add_epi64(_mm256_sllv_epi64(hv, sh1234), s1);
+        __m256i h2 = _mm256_add_epi64(_mm256_sllv_epi64(hv, sh5678), s2);
+        m = _mm256_movemask_epi8(_mm256_cmpeq_epi64(_mm256_and_si256(h1, vmask), zero));
+        if(m) {
+            return i + (__builtin_ctz(m) >> 3);
+        }
+        m = _mm256_movemask_epi8(_mm256_cmpeq_epi64(_mm256_and_si256(h2, vmask), zero));
+        if(m) {
+            return i + 4 + (__builtin_ctz(m) >> 3);
+        }
+        hh = _mm256_extract_epi64(h2, 3);
+        i += 8;
+    }
+    *h = hh;
+    /* less than 8 bytes left, finish with the scalar code */
+    return fastcdc_search_plain(table, p, i, end, mask, h);
+}
+
+#endif /* FASTCDC_HAVE_AVX2 */
+
+typedef size_t (*fastcdc_search_t)(const uint64_t *, const uint8_t *, size_t, size_t, uint64_t, uint64_t *);
+
+static fastcdc_search_t fastcdc_search = NULL;
+
+static void
+fastcdc_init_search(void)
+{
+    if(fastcdc_search != NULL)
+        return;
+#ifdef FASTCDC_HAVE_AVX2
+    if(__builtin_cpu_supports("avx2")) {
+        fastcdc_search = fastcdc_search_avx2;
+        return;
+    }
+#endif
+    fastcdc_search = fastcdc_search_plain;
+}
+
+/* find the cut point for the chunk starting at <p>, return the chunk length.
+ * <len> bytes are available, a full buffer (== max_size) unless we are at eof. */
+static size_t
+fastcdc_scan(FastCDC *c, const uint8_t *p, size_t len)
+{
+    uint64_t h = 0;
+    size_t i;
+    size_t barrier = len < c->avg_size ? len : c->avg_size;
+
+    /* cut-point skipping: the first min_size bytes are not hashed at all */
+    i = fastcdc_search(c->table, p, c->min_size, barrier, c->mask_s, &h);
+    if(i < barrier)
+        return i + 1;
+    i = fastcdc_search(c->table, p, barrier, len, c->mask_l, &h);
+    if(i < len)
+        return i + 1;
+    return len;
+}
+
+static PyObject *
+fastcdc_process(FastCDC *c)
+{
+    size_t n, old_last;
+
+    if(c->done) {
+        if(c->bytes_read == c->bytes_yielded)
+            PyErr_SetNone(PyExc_StopIteration);
+        else
+            PyErr_SetString(PyExc_Exception, "chunkifier byte count mismatch");
+        return NULL;
+    }
+    /* have a full buffer (or all data up to eof) available, so the maximum
+     * chunk size is enforced simply by the buffer size. */
+    while(c->remaining < c->buf_size && !c->eof) {
+        if(!fastcdc_fill(c)) {
+            return NULL;
+        }
+    }
+    if(c->remaining == 0) {
+        c->done = 1;
+        if(c->bytes_read == c->bytes_yielded)
+            PyErr_SetNone(PyExc_StopIteration);
+        else
+            PyErr_SetString(PyExc_Exception, "chunkifier byte count mismatch");
+        return NULL;
+    }
+    n = fastcdc_scan(c, c->data + c->position, c->remaining);
+    c->position += n;
+    c->remaining -= n;
+    old_last = c->last;
+    c->last = c->position;
+    c->bytes_yielded += n;
+    return PyMemoryView_FromMemory((char *)(c->data + old_last), n, PyBUF_READ);
+}
@@ -0,0 +1 @@
+__version__ = version = '2.0.0b7'
@@ -4,12 +4,12 @@ import os
 import stat
 import sys
 import time
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for_futures
 from contextlib import contextmanager
 from datetime import timedelta
 from functools import partial
 from getpass import getuser
-from io import BytesIO
 from itertools import groupby, zip_longest
 from typing import Iterator
 from shutil import get_terminal_size
@@ -45,13 +45,20 @@ from .helpers import sig_int
 from .helpers.lrucache import LRUCache
 from .manifest import Manifest
 from .patterns import PathPrefixPattern, FnmatchPattern, IECommand
-from .item import Item, ArchiveItem, ItemDiff
+from .item import Item, ArchiveItem, ItemDiff, ChunkList
 from .platform import acl_get, acl_set, set_flags, get_flags, swidth, hostname
 from .remote import cache_if_remote
 from .repository import Repository, LIST_SCAN_LIMIT
 from .repoobj import RepoObj
 
 has_link = hasattr(os, "link")
+has_writev = hasattr(os, "writev")
+
+# gather up to this many / this much decrypted chunk data before writing it out
+# with a single writev() syscall. the count must stay well below IOV_MAX (POSIX
+# guarantees >= 16, Linux has 1024).
+WRITEV_MAX_COUNT = 16
+WRITEV_MAX_BYTES = 8 * 1024 * 1024
 
 
 class Statistics:
@@ -283,6 +290,16 @@ class DownloadPipeline:
     def __init__(self, repository, repo_objs):
         self.repository = repository
         self.repo_objs = repo_objs
+        self._parse_executor = None
+
+    @property
+    def parse_executor(self):
+        # created lazily and shared by all fetch_many_parallel calls, so that e.g.
+        # extracting many small files does not spawn and join a thread per file.
+        # the interpreter joins leftover executor threads at exit.
+        if self._parse_executor is None:
+            self._parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parse")
+        return self._parse_executor
 
     def unpack_many(self, ids, *, filter=None, preload=False):
         """
@@ -300,10 +317,16 @@ class DownloadPipeline:
             unpacker.feed(data)
             for _item in unpacker:
                 item = Item(internal_dict=_item)
-                if "chunks" in item:
-                    item.chunks = [ChunkListEntry(*e) for e in item.chunks]
                 if filter and not filter(item):
+                    # note: filters only inspect metadata like path/mode, so the chunks list
+                    # conversion below can be skipped for all filtered-out items.
                     continue
+                if "chunks" in item:
+                    try:
+                        item.chunks = ChunkList(item.chunks)
+                    except (ValueError, OverflowError):
+                        # unexpected id length or size, keep the plain list representation
+                        item.chunks = [ChunkListEntry(*e) for e in item.chunks]
                 if preload and "chunks" in item:
                     hlid = item.get("hlid", None)
                     if hlid is None:
@@ -323,20 +346,84 @@ class DownloadPipeline:
             _, data = self.repo_objs.parse(id_, cdata)
             yield data
 
+    def fetch_many_parallel(self, ids, is_preloaded=False, window=8):
+        """
+        Like fetch_many, but decouples fetching from parsing (decrypting / decompressing):
+        parsing runs in a background thread while the caller is still busy processing
+        previous chunks and the repository is already fetching the following ones, so
+        repository latency, crypto cpu time and the caller's work (e.g. disk writes
+        when extracting) overlap instead of strictly alternating.
+
+        The plaintext chunks are yielded strictly in *ids* order. At most *window*
+        chunks are in flight at any time, to keep memory usage bounded.
+
+        Note: the key's cipher objects are not thread-safe, thus all parsing is done
+        by a single worker thread and there is no parsing concurrency (just overlap
+        with fetching / with the caller).
+        """
+        executor = self.parse_executor
+        parsed = deque()
+        try:
+            for id_, cdata in zip(ids, self.repository.get_many(ids, is_preloaded=is_preloaded)):
+                parsed.append(executor.submit(self.repo_objs.parse, id_, cdata))
+                if len(parsed) >= window:
+                    yield parsed.popleft().result()[1]
+            while parsed:
+                yield parsed.popleft().result()[1]
+        finally:
+            # if the consumer abandons us mid-stream (e.g. extract_item failing with
+            # a BackupOSError that the caller handles), the windowed parse futures
+            # must not keep running next to whoever parses next - the key's cipher
+            # objects are not thread-safe. cancel what is still queued and wait for
+            # the one in flight, then the worker is idle again.
+            for future in parsed:
+                future.cancel()
+            wait_for_futures(parsed)
+
+
+def pack_default(obj):
+    # a ChunkList is serialized exactly like the equivalent list of chunk entries,
+    # so the on-disk item format does not depend on the in-memory representation.
+    if isinstance(obj, ChunkList):
+        return list(obj)
+    raise TypeError("can not serialize %s object" % type(obj).__name__)
+
+
+class BufferReader:
+    """
+    Minimal file-like reader over a bytes-like object.
+
+    The C chunker calls fd.read(n) and requires actual bytes objects, so data is
+    copied out lazily in chunker-buffer-sized pieces, instead of the whole buffer
+    being copied up front as with BytesIO(bytes(buffer)).
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read(self, n):
+        data = bytes(self.data[self.pos : self.pos + n])
+        self.pos += len(data)
+        return data
+
 
 class ChunkBuffer:
     BUFFER_SIZE = 8 * 1024 * 1024
 
     def __init__(self, key, chunker_params=ITEMS_CHUNKER_PARAMS):
-        self.buffer = BytesIO()
-        self.packer = msgpack.Packer()
+        self.buffer = bytearray()  # packed items that were not yet cut into full chunks
+        # autoreset=False: packed items accumulate in the packer's internal buffer
+        # and are moved to self.buffer in one go on flush, instead of materializing
+        # an intermediate bytes object per item.
+        self.packer = msgpack.Packer(default=pack_default, autoreset=False)
         self.chunks = []
         self.key = key
         self.chunker = get_chunker(*chunker_params, seed=self.key.chunk_seed, sparse=False)
         self.saved_chunks_len = None
 
     def add(self, item):
-        self.buffer.write(self.packer.pack(item.as_dict()))
+        self.packer.pack(item.as_dict())
         if self.is_full():
             self.flush()
 
@@ -344,34 +431,40 @@ class ChunkBuffer:
         raise NotImplementedError
 
     def flush(self, flush=False):
-        if self.buffer.tell() == 0:
+        packed = self.packer.getbuffer()
+        if len(packed) > 0:
+            self.buffer += packed
+            del packed  # release the view of the packer's buffer before resetting it
+            self.packer.reset()
+        if not self.buffer:
             return
-        self.buffer.seek(0)
         # The chunker returns a memoryview to its internal buffer,
         # thus a copy is needed before resuming the chunker iterator.
         # the metadata stream may produce all-zero chunks, so deal
         # with CH_ALLOC (and CH_HOLE, for completeness) here.
         chunks = []
-        for chunk in self.chunker.chunkify(self.buffer):
-            alloc = chunk.meta["allocation"]
-            if alloc == CH_DATA:
-                data = bytes(chunk.data)
-            elif alloc in (CH_ALLOC, CH_HOLE):
-                data = zeros[: chunk.meta["size"]]
-            else:
-                raise ValueError("chunk allocation has unsupported value of %r" % alloc)
-            chunks.append(data)
-        self.buffer.seek(0)
-        self.buffer.truncate(0)
+        # the memoryview must be released before self.buffer is resized again below
+        with memoryview(self.buffer) as mv:
+            for chunk in self.chunker.chunkify(BufferReader(mv)):
+                alloc = chunk.meta["allocation"]
+                if alloc == CH_DATA:
+                    data = bytes(chunk.data)
+                elif alloc in (CH_ALLOC, CH_HOLE):
+                    data = zeros[: chunk.meta["size"]]
+                else:
+                    raise ValueError("chunk allocation has unsupported value of %r" % alloc)
+                chunks.append(data)
         # Leave the last partial chunk in the buffer unless flush is True
         end = None if flush or len(chunks) == 1 else -1
         for chunk in chunks[:end]:
             self.chunks.append(self.write_chunk(chunk))
         if end == -1:
-            self.buffer.write(chunks[-1])
+            self.buffer[:] = chunks[-1]
+        else:
+            del self.buffer[:]
 
     def is_full(self):
-        return self.buffer.tell() > self.BUFFER_SIZE
+        return len(self.buffer) + len(self.packer.getbuffer()) > self.BUFFER_SIZE
 
     def save_chunks_state(self):
         # as we only append to self.chunks, remembering the current length is good enough
@@ -481,6 +574,7 @@ class Archive:
         iec=False,
     ):
         self.cwd = os.getcwd()
+        self._mkdir_cache = set()  # parent directories we already created during extraction
         assert isinstance(manifest, Manifest)
         self.manifest = manifest
         self.key = manifest.repo_objs.key
@@ -737,10 +831,9 @@ Duration: {0.duration}
                 msg="Calculating statistics for archive %s ... %%3.0f%%%%" % arch_name_escd,
                 msgid="archive.calc_stats",
             )
-            for id, chunk in zip(self.metadata.items, self.repository.get_many(self.metadata.items)):
+            for id, data in zip(self.metadata.items, self.pipeline.fetch_many_parallel(self.metadata.items)):
                 pi.show(increase=1)
                 add(id)
-                _, data = self.repo_objs.parse(id, chunk)
                 sync.feed(data)
             unique_size = archive_index.stats_against(cache.chunks)[1]
             pi.finish()
@@ -855,6 +948,7 @@ Duration: {0.duration}
                 return  # done! we already have fully extracted this file in a previous run.
             elif stat.S_ISDIR(st.st_mode):
                 os.rmdir(path)
+                self._mkdir_cache.discard(path)
             else:
                 os.unlink(path)
         except UnicodeEncodeError:
@@ -863,9 +957,13 @@ Duration: {0.duration}
             pass
 
         def make_parent(path):
+            # extraction usually creates many entries per directory, so remember the
+            # parents we already made and skip the stat/mkdir syscalls the next times.
             parent_dir = os.path.dirname(path)
-            if not os.path.exists(parent_dir):
-                os.makedirs(parent_dir)
+            if parent_dir in self._mkdir_cache:
+                return
+            os.makedirs(parent_dir, exist_ok=True)
+            self._mkdir_cache.add(parent_dir)
 
         mode = item.mode
         if stat.S_ISREG(mode):
@@ -875,22 +973,47 @@ Duration: {0.duration}
                 if hardlink_set:
                     return
                 with backup_io("open"):
-                    fd = open(path, "wb")
+                    # buffering=0 gives us a raw (unbuffered) file object. we write whole chunks
+                    # anyway, so a python-level write buffer would only add copies and overhead.
+                    fd = open(path, "wb", buffering=0)
                 with fd:
                     ids = [c.id for c in item.chunks]
-                    for data in self.pipeline.fetch_many(ids, is_preloaded=True):
+                    pending = []  # decrypted chunks, gathered into one writev() syscall
+                    pending_bytes = 0
+
+                    def write_pending():
+                        nonlocal pending_bytes
+                        with backup_io("write"):
+                            while pending:
+                                if has_writev:
+                                    n = os.writev(fd.fileno(), pending)
+                                else:
+                                    n = fd.write(pending[0])
+                                # deal with partial writes (e.g. when the disk fills up)
+                                while pending and n >= len(pending[0]):
+                                    n -= len(pending[0])
+                                    del pending[0]
+                                if n:
+                                    pending[0] = memoryview(pending[0])[n:]
+                        pending_bytes = 0
+
+                    for data in self.pipeline.fetch_many_parallel(ids, is_preloaded=True):
                         if pi:
                             pi.show(increase=len(data), info=[remove_surrogates(item.path)])
-                        with backup_io("write"):
-                            if sparse and zeros.startswith(data):
-                                # all-zero chunk: create a hole in a sparse file
+                        if sparse and zeros.startswith(data):
+                            # all-zero chunk: create a hole in a sparse file
+                            write_pending()
+                            with backup_io("seek"):
                                 fd.seek(len(data), 1)
-                            else:
-                                fd.write(data)
+                        else:
+                            pending.append(data)
+                            pending_bytes += len(data)
+                            if len(pending) >= WRITEV_MAX_COUNT or pending_bytes >= WRITEV_MAX_BYTES:
+                                write_pending()
+                    write_pending()
                     with backup_io("truncate_and_attrs"):
                         pos = item_chunks_size = fd.tell()
                         fd.truncate(pos)
-                        fd.flush()
                         self.restore_attrs(path, item, fd=fd.fileno())
                 if "size" in item:
                     item_size = item.size
@@ -1073,10 +1196,9 @@ Duration: {0.duration}
             pi = ProgressIndicatorPercent(
                 total=len(items_ids), msg="Decrementing references %3.0f%%", msgid="archive.delete"
             )
-            for i, (items_id, data) in enumerate(zip(items_ids, self.repository.get_many(items_ids))):
+            for i, (items_id, data) in enumerate(zip(items_ids, self.pipeline.fetch_many_parallel(items_ids))):
                 if progress:
                     pi.show(i)
-                _, data = self.repo_objs.parse(items_id, data)
                 unpacker.feed(data)
                 chunk_decref(items_id, stats)
                 try:
@@ -1207,8 +1329,9 @@ class MetadataCollector:
                 attrs["group"] = group
         return attrs
 
-    def stat_ext_attrs(self, st, path, fd=None):
-        attrs = {}
+    def stat_ext_attrs(self, st, path, fd=None, attrs=None):
+        if attrs is None:
+            attrs = {}
         if not self.noflags:
             with backup_io("extended stat (flags)"):
                 flags = get_flags(path, st, fd=fd)
@@ -1223,9 +1346,8 @@ class MetadataCollector:
         return attrs
 
     def stat_attrs(self, st, path, fd=None):
-        attrs = self.stat_simple_attrs(st)
-        attrs.update(self.stat_ext_attrs(st, path, fd=fd))
-        return attrs
+        # fill a single dict in place instead of merging two - this runs once per archived item
+        return self.stat_ext_attrs(st, path, fd=fd, attrs=self.stat_simple_attrs(st))
 
 
 # remember a few recently used all-zero chunk hashes in this mapping.
@@ -1368,7 +1490,20 @@ class FilesystemObjectProcessors:
         self.hlm = HardLinkManager(id_type=tuple, info_type=(list, type(None)))  # (dev, ino) -> chunks or None
         self.stats = Statistics(output_json=log_json, iec=iec)  # threading: done by cache (including progress)
         self.cwd = os.getcwd()
+        # encoded cwd prefix for building the files cache key, precomputed once, see process_file
+        self._cwd_prefix = safe_encode(os.path.join(self.cwd, ""))
         self.chunker = get_chunker(*chunker_params, seed=key.chunk_seed, sparse=sparse)
+        # files up to this size fit into a single minimum-sized chunk anyway, so process_file
+        # can read them in one go and skip the chunker machinery entirely.
+        algo = chunker_params[0]
+        if algo in (CH_BUZHASH, CH_FASTCDC):
+            self.small_file_max_size = 1 << chunker_params[1]  # the chunker's minimum chunk size
+        elif algo == CH_FIXED and (len(chunker_params) < 3 or chunker_params[2] == 0):
+            # plain fixed blocks without a header chunk (ChunkerParams always yields a
+            # 3-tuple here, with header_size == 0 when no header was given)
+            self.small_file_max_size = chunker_params[1]
+        else:
+            self.small_file_max_size = 0  # disable the fast path
 
     @contextmanager
     def create_helper(self, path, st, status=None, hardlinkable=True):
@@ -1499,7 +1634,12 @@ class FilesystemObjectProcessors:
                             item.chunks.append(chunk_entry)
                     else:  # normal case, no "2nd+" hardlink
                         if not is_special_file:
-                            hashed_path = safe_encode(os.path.join(self.cwd, path))
+                            # same bytes as safe_encode(os.path.join(self.cwd, path)), but without
+                            # re-joining / re-encoding the constant cwd prefix for every file.
+                            if os.path.isabs(path):
+                                hashed_path = safe_encode(os.path.join(self.cwd, path))
+                            else:
+                                hashed_path = self._cwd_prefix + safe_encode(path)
                             started_hashing = time.monotonic()
                             path_hash = self.key.id_hash(hashed_path)
                             self.stats.hashing_time += time.monotonic() - started_hashing
@@ -1531,14 +1671,42 @@ class FilesystemObjectProcessors:
                         changed_while_backup = False
                         if "chunks" not in item:
                             with backup_io("read"):
-                                self.process_file_chunks(
-                                    item,
-                                    cache,
-                                    self.stats,
-                                    self.show_progress,
-                                    backup_io_iter(self.chunker.chunkify(None, fd)),
-                                )
-                                self.stats.chunking_time = self.chunker.chunking_time
+                                small_max = self.small_file_max_size
+                                data = None
+                                if not is_special_file and st.st_size <= small_max:
+                                    # the whole file should fit into a single minimum-sized chunk,
+                                    # so read it in one go instead of running the chunker over it.
+                                    # read a bit more than allowed, so we notice if the file is in
+                                    # fact bigger (grew or st_size lied, like e.g. on procfs).
+                                    data = os.read(fd, small_max + 1)
+                                    while data and len(data) <= small_max:
+                                        more = os.read(fd, small_max + 1 - len(data))
+                                        if not more:
+                                            break
+                                        data += more
+                                if data is not None and len(data) <= small_max:
+                                    if data and zeros.startswith(data):
+                                        # all-zero, represent it like the chunkers do
+                                        small_chunks = [Chunk(None, size=len(data), allocation=CH_ALLOC)]
+                                    elif data:
+                                        small_chunks = [Chunk(data, size=len(data), allocation=CH_DATA)]
+                                    else:
+                                        small_chunks = []  # empty file
+                                    self.process_file_chunks(
+                                        item, cache, self.stats, self.show_progress, iter(small_chunks)
+                                    )
+                                else:
+                                    if data is not None:
+                                        # file is bigger than st_size made us believe: chunk it normally
+                                        os.lseek(fd, 0, os.SEEK_SET)
+                                    self.process_file_chunks(
+                                        item,
+                                        cache,
+                                        self.stats,
+                                        self.show_progress,
+                                        backup_io_iter(self.chunker.chunkify(None, fd)),
+                                    )
+                                    self.stats.chunking_time = self.chunker.chunking_time
                             if not is_win32:  # TODO for win32
                                 with backup_io("fstat2"):
                                     st2 = os.fstat(fd)
@@ -1741,15 +1909,24 @@ class RobustUnpacker:
     def __next__(self):
         if self._resync:
             data = b"".join(self._buffered_data)
-            while self._resync:
-                if not data:
-                    raise StopIteration
-                # Abort early if the data does not look like a serialized item dict
-                if not valid_msgpacked_dict(data, self.item_keys):
-                    data = data[1:]
+            # only positions where a serialized item key follows a map header can be
+            # the start of an item dict, so instead of advancing through the garbage
+            # one byte at a time, jump directly to the occurrences of the key names.
+            # a fixmap header is 1 byte, a map16 header is 3 bytes, thus a key found
+            # at position q means the dict would start at q - 1 or q - 3.
+            starts = set()
+            for key in self.item_keys:
+                q = data.find(key, 1)
+                while q != -1:
+                    starts.update((q - 3, q - 1))
+                    q = data.find(key, q + 1)
+            for start in sorted(s for s in starts if s >= 0):
+                candidate = data[start:]
+                # Skip if the data does not look like a serialized item dict
+                if not valid_msgpacked_dict(candidate, self.item_keys):
                     continue
                 self._unpacker = msgpack.Unpacker(object_hook=StableDict)
-                self._unpacker.feed(data)
+                self._unpacker.feed(candidate)
                 try:
                     item = next(self._unpacker)
                 except (msgpack.UnpackException, StopIteration):
@@ -1759,7 +1936,7 @@ class RobustUnpacker:
                     if self.validator(item):
                         self._resync = False
                         return item
-                data = data[1:]
+            raise StopIteration
         else:
             return next(self._unpacker)
 
@@ -2081,11 +2258,17 @@ class ArchiveChecker:
                 del item.chunks_healthy
                 has_chunks_healthy = False
                 chunks_healthy = chunks_current
+            chunks = self.chunks  # hoist the attribute lookup out of the per-chunk loop
             for chunk_current, chunk_healthy in zip(chunks_current, chunks_healthy):
                 chunk_id, size = chunk_healthy
-                if chunk_id not in self.chunks:
-                    # a chunk of the healthy list is missing
-                    if chunk_current == chunk_healthy:
+                if chunk_current == chunk_healthy:
+                    # normal case: try the (C-backed) incref directly instead of doing a
+                    # separate membership test plus add_reference(), this saves one
+                    # hashindex lookup and a closure call per chunk in the hot path.
+                    try:
+                        chunks.incref(chunk_id)
+                    except KeyError:
+                        # a chunk of the healthy list is missing
                         logger.error(
                             "{}: {}: New missing file chunk detected (Byte {}-{}, Chunk {}). "
                             "Replacing with all-zero chunk.".format(
@@ -2095,38 +2278,34 @@ class ArchiveChecker:
                         self.error_found = chunks_replaced = True
                         chunk_id, size, cdata = replacement_chunk(size)
                         add_reference(chunk_id, size, cdata)
-                    else:
-                        logger.info(
-                            "{}: {}: Previously missing file chunk is still missing (Byte {}-{}, Chunk {}). "
-                            "It has an all-zero replacement chunk already.".format(
-                                archive_name, item.path, offset, offset + size, bin_to_hex(chunk_id)
-                            )
+                elif chunk_id not in chunks:
+                    logger.info(
+                        "{}: {}: Previously missing file chunk is still missing (Byte {}-{}, Chunk {}). "
+                        "It has an all-zero replacement chunk already.".format(
+                            archive_name, item.path, offset, offset + size, bin_to_hex(chunk_id)
                         )
-                        chunk_id, size = chunk_current
-                        if chunk_id in self.chunks:
-                            add_reference(chunk_id, size)
-                        else:
-                            logger.warning(
-                                "{}: {}: Missing all-zero replacement chunk detected (Byte {}-{}, Chunk {}). "
-                                "Generating new replacement chunk.".format(
-                                    archive_name, item.path, offset, offset + size, bin_to_hex(chunk_id)
-                                )
-                            )
-                            self.error_found = chunks_replaced = True
-                            chunk_id, size, cdata = replacement_chunk(size)
-                            add_reference(chunk_id, size, cdata)
-                else:
-                    if chunk_current == chunk_healthy:
-                        # normal case, all fine.
+                    )
+                    chunk_id, size = chunk_current
+                    if chunk_id in chunks:
                         add_reference(chunk_id, size)
                     else:
-                        logger.info(
-                            "{}: {}: Healed previously missing file chunk! (Byte {}-{}, Chunk {}).".format(
+                        logger.warning(
+                            "{}: {}: Missing all-zero replacement chunk detected (Byte {}-{}, Chunk {}). "
+                            "Generating new replacement chunk.".format(
                                 archive_name, item.path, offset, offset + size, bin_to_hex(chunk_id)
                             )
                         )
-                        add_reference(chunk_id, size)
-                        mark_as_possibly_superseded(chunk_current[0])  # maybe orphaned the all-zero replacement chunk
+                        self.error_found = chunks_replaced = True
+                        chunk_id, size, cdata = replacement_chunk(size)
+                        add_reference(chunk_id, size, cdata)
+                else:
+                    logger.info(
+                        "{}: {}: Healed previously missing file chunk! (Byte {}-{}, Chunk {}).".format(
+                            archive_name, item.path, offset, offset + size, bin_to_hex(chunk_id)
+                        )
+                    )
+                    add_reference(chunk_id, size)
+                    mark_as_possibly_superseded(chunk_current[0])  # maybe orphaned the all-zero replacement chunk
                 chunk_list.append([chunk_id, size])  # list-typed element as chunks_healthy is list-of-lists
                 offset += size
             if chunks_replaced and not has_chunks_healthy:
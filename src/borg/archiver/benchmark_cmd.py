@@ -118,6 +118,7 @@ class BenchmarkMixIn:
 
         for spec, func in [
             ("buzhash,19,23,21,4095", lambda: chunkit("buzhash", 19, 23, 21, 4095, seed=0)),
+            ("fastcdc,19,23,21", lambda: chunkit("fastcdc", 19, 23, 21, seed=0)),
             ("fixed,1048576", lambda: chunkit("fixed", 1048576, sparse=False)),
         ]:
             print(f"{spec:<24} {size:<10} {timeit(func, number=100):.3f}s")
@@ -6,7 +6,7 @@ import stat
 import tarfile
 import time
 
-from ..archive import Archive, TarfileObjectProcessors, ChunksProcessor
+from ..archive import Archive, TarfileObjectProcessors, ChunksProcessor, pack_default
 from ..compress import CompressionSpec
 from ..constants import *  # NOQA
 from ..helpers import HardLinkManager
@@ -214,7 +214,8 @@ class TarMixIn:
             if format == "BORG":  # BORG format additions
                 ph["BORG.item.version"] = "1"
                 # BORG.item.meta - just serialize all metadata we have:
-                meta_bin = msgpack.packb(item.as_dict())
+                # (needs pack_default, as item.chunks may be a ChunkList)
+                meta_bin = msgpack.packb(item.as_dict(), default=pack_default)
                 meta_text = base64.b64encode(meta_bin).decode()
                 ph["BORG.item.meta"] = meta_text
             return ph
@@ -30,3 +30,7 @@ class Chunker:
         self, seed: int, chunk_min_exp: int, chunk_max_exp: int, hash_mask_bits: int, hash_window_size: int
     ) -> None: ...
     def chunkify(self, fd: BinaryIO = None, fh: int = -1) -> Iterator: ...
+
+class ChunkerFastCDC:
+    def __init__(self, seed: int, chunk_min_exp: int, chunk_max_exp: int, hash_mask_bits: int) -> None: ...
+    def chunkify(self, fd: BinaryIO = None, fh: int = -1) -> Iterator: ...
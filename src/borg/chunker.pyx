@@ -6,6 +6,7 @@ import time
 from collections import namedtuple
 
 from .constants import CH_DATA, CH_ALLOC, CH_HOLE, zeros
+from .helpers.datastruct import BufferPool
 
 from libc.stdlib cimport free
 
@@ -21,6 +22,14 @@ cdef extern from "_chunker.c":
     uint32_t c_buzhash "buzhash"(unsigned char *data, size_t len, uint32_t *h)
     uint32_t c_buzhash_update  "buzhash_update"(uint32_t sum, unsigned char remove, unsigned char add, size_t len, uint32_t *h)
 
+cdef extern from "_fastcdc.c":
+    ctypedef struct _FastCDC "FastCDC":
+        pass
+    _FastCDC *fastcdc_init(size_t min_size, size_t avg_size, size_t max_size, int mask_bits, uint32_t seed)
+    void fastcdc_set_fd(_FastCDC *chunker, object f, int fd)
+    void fastcdc_free(_FastCDC *chunker)
+    object fastcdc_process(_FastCDC *chunker)
+
 
 # this will be True if Python's seek implementation supports data/holes seeking.
 # this does not imply that it will actually work on the filesystem,
@@ -65,6 +74,33 @@ def dread(offset, size, fd=None, fh=-1):
         return fd.read(size)
 
 
+# pool of recycled read buffers for dread_into / the fixed chunker.
+# buffers bigger than the biggest chunk are not worth keeping around.
+read_buffer_pool = BufferPool(max_size=len(zeros))
+
+
+def dread_into(buf, offset, size, fd=None, fh=-1):
+    """like dread, but read into the given buffer, return a memoryview of the data read."""
+    use_fh = fh >= 0
+    if use_fh:
+        with memoryview(buf)[:size] as mv:
+            got = os.readv(fh, [mv])
+        if hasattr(os, 'posix_fadvise'):
+            # see comment in dread.
+            os.posix_fadvise(fh, offset, got, os.POSIX_FADV_DONTNEED)
+        return memoryview(buf)[:got]
+    elif hasattr(fd, 'readinto'):
+        with memoryview(buf)[:size] as mv:
+            got = fd.readinto(mv)
+        return memoryview(buf)[:got]
+    else:
+        # file-like object without readinto, can not avoid the extra copy
+        data = fd.read(size)
+        got = len(data)
+        buf[:got] = data
+        return memoryview(buf)[:got]
+
+
 def dseek(amount, whence, fd=None, fh=-1):
     use_fh = fh >= 0
     if use_fh:
@@ -240,38 +276,45 @@ class ChunkerFixed:
                 fmap = header_map + body_map
 
         offset = 0
-        for range_start, range_size, is_data in fmap:
-            if range_start != offset:
-                # this is for the case when the fmap does not cover the file completely,
-                # e.g. it could be without the ranges of holes or of unchanged data.
-                offset = range_start
-                dseek(offset, os.SEEK_SET, fd, fh)
-            while range_size:
-                started_chunking = time.monotonic()
-                wanted = min(range_size, self.block_size)
-                if is_data:
-                    # read block from the range
-                    data = dread(offset, wanted, fd, fh)
-                    got = len(data)
-                    if zeros.startswith(data):
+        # we read blocks into a recycled buffer and yield memoryviews into it,
+        # like the content-defined chunkers do - consumers must copy the data
+        # before resuming the iterator.
+        buf = read_buffer_pool.get(self.block_size)
+        try:
+            for range_start, range_size, is_data in fmap:
+                if range_start != offset:
+                    # this is for the case when the fmap does not cover the file completely,
+                    # e.g. it could be without the ranges of holes or of unchanged data.
+                    offset = range_start
+                    dseek(offset, os.SEEK_SET, fd, fh)
+                while range_size:
+                    started_chunking = time.monotonic()
+                    wanted = min(range_size, self.block_size)
+                    if is_data:
+                        # read block from the range
+                        data = dread_into(buf, offset, wanted, fd, fh)
+                        got = len(data)
+                        if zeros.startswith(data):
+                            data = None
+                            allocation = CH_ALLOC
+                        else:
+                            allocation = CH_DATA
+                    else:  # hole
+                        # seek over block from the range
+                        pos = dseek(wanted, os.SEEK_CUR, fd, fh)
+                        got = pos - offset
                         data = None
-                        allocation = CH_ALLOC
-                    else:
-                        allocation = CH_DATA
-                else:  # hole
-                    # seek over block from the range
-                    pos = dseek(wanted, os.SEEK_CUR, fd, fh)
-                    got = pos - offset
-                    data = None
-                    allocation = CH_HOLE
-                if got > 0:
-                    offset += got
-                    range_size -= got
-                    self.chunking_time += time.monotonic() - started_chunking
-                    yield Chunk(data, size=got, allocation=allocation)
-                if got < wanted:
-                    # we did not get enough data, looks like EOF.
-                    return
+                        allocation = CH_HOLE
+                    if got > 0:
+                        offset += got
+                        range_size -= got
+                        self.chunking_time += time.monotonic() - started_chunking
+                        yield Chunk(data, size=got, allocation=allocation)
+                    if got < wanted:
+                        # we did not get enough data, looks like EOF.
+                        return
+        finally:
+            read_buffer_pool.put(buf)
 
 
 cdef class Chunker:
@@ -334,10 +377,68 @@ cdef class Chunker:
         return Chunk(data, size=got, allocation=allocation)
 
 
+cdef class ChunkerFastCDC:
+    """
+    Content-Defined Chunker, variable chunk sizes, using the FastCDC algorithm.
+
+    Like the buzhash chunker, it cuts mostly chunks of the same content, even if
+    the content moves to a different offset inside the file. Instead of a rolling
+    hash over a window, it uses a gear hash (one table lookup, one shift and one
+    add per byte) plus chunk size normalization, which makes chunking considerably
+    faster at similar deduplication rates.
+    It also uses a per-repo random seed to avoid some chunk length fingerprinting attacks.
+    """
+    cdef _FastCDC *chunker
+    cdef readonly float chunking_time
+
+    def __cinit__(self, int seed, int chunk_min_exp, int chunk_max_exp, int hash_mask_bits):
+        min_size = 1 << chunk_min_exp
+        avg_size = 1 << hash_mask_bits
+        max_size = 1 << chunk_max_exp
+        assert max_size <= len(zeros)
+        assert chunk_min_exp < hash_mask_bits < chunk_max_exp
+        self.chunker = fastcdc_init(min_size, avg_size, max_size, hash_mask_bits, seed & 0xffffffff)
+        self.chunking_time = 0.0
+
+    def chunkify(self, fd, fh=-1):
+        """
+        Cut a file into chunks.
+
+        :param fd: Python file object
+        :param fh: OS-level file handle (if available),
+                   defaults to -1 which means not to use OS-level fd.
+        """
+        fastcdc_set_fd(self.chunker, fd, fh)
+        return self
+
+    def __dealloc__(self):
+        if self.chunker:
+            fastcdc_free(self.chunker)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        started_chunking = time.monotonic()
+        data = fastcdc_process(self.chunker)
+        got = len(data)
+        # same all-zero detection as in Chunker.__next__, see comment there.
+        if zeros.startswith(data):
+            data = None
+            allocation = CH_ALLOC
+        else:
+            allocation = CH_DATA
+        self.chunking_time += time.monotonic() - started_chunking
+        return Chunk(data, size=got, allocation=allocation)
+
+
 def get_chunker(algo, *params, **kw):
     if algo == 'buzhash':
         seed = kw['seed']
         return Chunker(seed, *params)
+    if algo == 'fastcdc':
+        seed = kw['seed']
+        return ChunkerFastCDC(seed, *params)
     if algo == 'fixed':
         sparse = kw['sparse']
         return ChunkerFixed(*params, sparse=sparse)
@@ -3,7 +3,7 @@ import hmac
 import os
 import textwrap
 from binascii import a2b_base64, b2a_base64, hexlify
-from hashlib import sha256, pbkdf2_hmac
+from hashlib import blake2b, sha256, pbkdf2_hmac
 from typing import Literal, Callable, ClassVar
 
 from ..logger import create_logger
@@ -27,7 +27,7 @@ from ..platform import SaveFile
 from ..repoobj import RepoObj
 
 
-from .low_level import AES, bytes_to_int, num_cipher_blocks, hmac_sha256, blake2b_256, hkdf_hmac_sha512
+from .low_level import AES, bytes_to_int, num_cipher_blocks, hmac_sha256, hkdf_hmac_sha512
 from .low_level import AES256_CTR_HMAC_SHA256, AES256_CTR_BLAKE2b, AES256_OCB, CHACHA20_POLY1305
 from . import low_level
 
@@ -360,8 +360,19 @@ class ID_BLAKE2b_256:
     The id_key length must be 32 bytes.
     """
 
+    # id_hash is called once per chunk, so we avoid re-hashing the 128 byte key
+    # block every time by keeping a hash state template with the key already fed
+    # in and copying it per call. The digest is the same as blake2b_256(id_key, data).
+    _id_hash_tmpl = None
+    _id_hash_tmpl_key = None
+
     def id_hash(self, data):
-        return blake2b_256(self.id_key, data)
+        if self._id_hash_tmpl_key is not self.id_key:
+            self._id_hash_tmpl = blake2b(self.id_key, digest_size=32)
+            self._id_hash_tmpl_key = self.id_key
+        h = self._id_hash_tmpl.copy()
+        h.update(data)
+        return h.digest()
 
     def init_from_random_data(self):
         super().init_from_random_data()
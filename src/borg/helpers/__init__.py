@@ -9,7 +9,7 @@ import os
 
 from ..constants import *  # NOQA
 from .checks import check_extension_modules, check_python
-from .datastruct import StableDict, Buffer, EfficientCollectionQueue
+from .datastruct import StableDict, Buffer, BufferPool, EfficientCollectionQueue
 from .errors import Error, ErrorWithTraceback, IntegrityError, DecompressionError
 from .fs import ensure_dir, join_base_dir, get_socket_filename
 from .fs import get_security_dir, get_keys_dir, get_base_dir, get_cache_dir, get_config_dir, get_runtime_dir
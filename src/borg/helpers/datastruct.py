@@ -1,3 +1,5 @@
+import threading
+
 from .errors import Error
 
 
@@ -52,6 +54,45 @@ class Buffer:
         return self.buffer
 
 
+class BufferPool:
+    """
+    Thread-local pool of reusable bytearray buffers.
+
+    Hot loops that need a scratch buffer per iteration (like the fixed chunker's
+    read loop) can get() a recycled buffer instead of allocating a fresh one every
+    time, which avoids allocator pressure and page faults for large buffers.
+
+    get(size) returns a buffer of at least the requested size, put(buf) gives it
+    back for reuse. Per thread, at most *max_buffers* buffers are kept and only
+    buffers up to *max_size* are pooled (bigger ones are simply dropped).
+    """
+
+    def __init__(self, max_buffers=4, max_size=None):
+        self.max_buffers = max_buffers
+        self.max_size = max_size
+        self._local = threading.local()
+
+    def get(self, size):
+        if self.max_size is not None and size > self.max_size:
+            return bytearray(size)
+        buffers = getattr(self._local, "buffers", None)
+        if buffers:
+            buf = buffers.pop()
+            if len(buf) < size:
+                buf = bytearray(size)
+            return buf
+        return bytearray(size)
+
+    def put(self, buf):
+        if self.max_size is not None and len(buf) > self.max_size:
+            return
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = []
+        if len(buffers) < self.max_buffers:
+            buffers.append(buf)
+
+
 class EfficientCollectionQueue:
     """
     An efficient FIFO queue that splits received elements into chunks.
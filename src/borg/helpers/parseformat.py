@@ -162,6 +162,20 @@ def ChunkerParams(s):
                 "block_size and header_size must not exceed MAX_DATA_SIZE [%d]" % MAX_DATA_SIZE
             )
         return algo, block_size, header_size
+    if algo == CH_FASTCDC and count == 4:  # fastcdc, chunk_min, chunk_max, chunk_mask
+        chunk_min, chunk_max, chunk_mask = (int(p) for p in params[1:])
+        if not (chunk_min < chunk_mask < chunk_max):
+            raise argparse.ArgumentTypeError("required: chunk_min < chunk_mask < chunk_max")
+        if chunk_min < 6:
+            # see comment in 'fixed' algo check
+            raise argparse.ArgumentTypeError(
+                "min. chunk size exponent must not be less than 6 (2^6 = 64B min. chunk size)"
+            )
+        if chunk_max > 23:
+            raise argparse.ArgumentTypeError(
+                "max. chunk size exponent must not be more than 23 (2^23 = 8MiB max. chunk size)"
+            )
+        return CH_FASTCDC, chunk_min, chunk_max, chunk_mask
     if algo == "default" and count == 1:  # default
         return CHUNKER_PARAMS
     # this must stay last as it deals with old-style compat mode (no algorithm, 4 params, buzhash):
@@ -103,6 +103,15 @@ class ChunkListEntry(NamedTuple):
     id: bytes
     size: int
 
+class ChunkList:
+    ID_LEN: int
+    ids: bytes
+    sizes: Any
+    def __init__(self, entries: Iterator = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, i: int) -> ChunkListEntry: ...
+    def __iter__(self) -> Iterator[ChunkListEntry]: ...
+
 class Item(PropDict):
     @property
     def path(self) -> str: ...
@@ -1,4 +1,5 @@
 import stat
+from array import array
 from collections import namedtuple
 
 from libc.string cimport memcmp
@@ -177,6 +178,9 @@ cdef class PropDict:
 
     def as_dict(self):
         """return the internal dictionary"""
+        # note: keep the StableDict wrap. msgpack packs dict subclasses via .items(),
+        # which StableDict returns sorted, so this is what gives serialized items their
+        # canonical key order - the copy itself is cheap, sorting happens at pack time.
         return StableDict(self._dict)
 
     def _check_key(self, key):
@@ -247,6 +251,64 @@ cdef class PropDictProperty:
 
 ChunkListEntry = namedtuple('ChunkListEntry', 'id size')
 
+
+class ChunkList:
+    """
+    Memory-dense, read-only replacement for a list of ChunkListEntry.
+
+    A list of entries needs one namedtuple, one bytes and often one int object per
+    chunk - traversing it is pointer chasing all over the heap. This class stores
+    all chunk ids concatenated into a single bytes object and all sizes in a compact
+    array ("structure of arrays"), so a big chunk list needs only 3 objects overall
+    and scanning over the ids or sizes touches contiguous memory.
+
+    Entries are materialized as ChunkListEntry on access, so iteration, indexing
+    and tuple unpacking work the same as with a plain list of entries.
+    """
+
+    ID_LEN = 32  # all borg id hashes are 256 bits
+
+    __slots__ = ('ids', 'sizes')
+
+    def __init__(self, entries=None):
+        self.sizes = array('I')
+        if entries:
+            ids = []
+            for id, size in entries:
+                ids.append(id)
+                self.sizes.append(size)
+            self.ids = b''.join(ids)
+            if len(self.ids) != len(self.sizes) * self.ID_LEN:
+                raise ValueError('ChunkList requires %d byte chunk ids' % self.ID_LEN)
+        else:
+            self.ids = b''
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self.sizes)))]
+        n = len(self.sizes)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('ChunkList index out of range')
+        return ChunkListEntry(self.ids[i * self.ID_LEN:(i + 1) * self.ID_LEN], self.sizes[i])
+
+    def __iter__(self):
+        ids, id_len = self.ids, self.ID_LEN
+        for i, size in enumerate(self.sizes):
+            yield ChunkListEntry(ids[i * id_len:(i + 1) * id_len], size)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, ChunkList)):
+            return NotImplemented
+        return len(self) == len(other) and all(e1 == e2 for e1, e2 in zip(self, other))
+
+    def __repr__(self):
+        return 'ChunkList(%r)' % list(self)
+
 cdef class Item(PropDict):
     """
     Item abstraction that deals with validation and the low-level details internally:
@@ -291,8 +353,8 @@ cdef class Item(PropDict):
     hlid = PropDictProperty(bytes)  # hard link id: same value means same hard link.
     hardlink_master = PropDictProperty(bool)  # legacy
 
-    chunks = PropDictProperty(list, 'list')
-    chunks_healthy = PropDictProperty(list, 'list')
+    chunks = PropDictProperty((list, ChunkList), 'list of chunk entries')
+    chunks_healthy = PropDictProperty((list, ChunkList), 'list of chunk entries')
 
     xattrs = PropDictProperty(StableDict)
 
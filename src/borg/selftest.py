@@ -23,7 +23,7 @@ from unittest import TestResult, TestSuite, defaultTestLoader
 
 from .testsuite.hashindex import HashIndexDataTestCase, HashIndexRefcountingTestCase, HashIndexTestCase
 from .testsuite.crypto import CryptoTestCase
-from .testsuite.chunker import ChunkerTestCase
+from .testsuite.chunker import ChunkerTestCase, ChunkerFastCDCTestCase
 
 SELFTEST_CASES = [
     HashIndexDataTestCase,
@@ -31,9 +31,10 @@ SELFTEST_CASES = [
     HashIndexTestCase,
     CryptoTestCase,
     ChunkerTestCase,
+    ChunkerFastCDCTestCase,
 ]
 
-SELFTEST_COUNT = 38
+SELFTEST_COUNT = 41
 
 
 class SelfTestResult(TestResult):
@@ -159,11 +159,11 @@ def test_partial_cache_chunk_buffer():
     chunks.flush(flush=False)
     # the code is expected to leave the last partial chunk in the buffer
     assert len(chunks.chunks) == 3
-    assert chunks.buffer.tell() > 0
+    assert len(chunks.buffer) > 0
     # now really flush
     chunks.flush(flush=True)
     assert len(chunks.chunks) == 4
-    assert chunks.buffer.tell() == 0
+    assert len(chunks.buffer) == 0
     unpacker = msgpack.Unpacker()
     for id in chunks.chunks:
         unpacker.feed(cache.objects[id])
@@ -3,7 +3,7 @@
 
 from io import BytesIO
 
-from ..chunker import ChunkerFixed, Chunker, get_chunker, buzhash, buzhash_update
+from ..chunker import ChunkerFixed, Chunker, ChunkerFastCDC, get_chunker, buzhash, buzhash_update
 from ..constants import *  # NOQA
 from . import BaseTestCase
 
@@ -139,3 +139,53 @@ class ChunkerTestCase(BaseTestCase):
         chunker = get_chunker(*CHUNKER_PARAMS, seed=0)
         reconstructed = b"".join(cf(chunker.chunkify(SmallReadFile())))
         assert reconstructed == b"a" * 20
+
+
+def pseudo_random_bytes(n, seed=42):
+    """some deterministic, aperiodic test data (the self test must not depend on os.urandom)"""
+    out = bytearray(n)
+    x = seed
+    for i in range(n):
+        x = (x * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        out[i] = x >> 56
+    return bytes(out)
+
+
+class ChunkerFastCDCTestCase(BaseTestCase):
+    def test_chunkify(self):
+        data = pseudo_random_bytes(1 << 14)
+        parts = cf(ChunkerFastCDC(0, 6, 12, 9).chunkify(BytesIO(data)))
+        self.assert_equal(b"".join(parts), data)
+        # all chunks except the last one must obey the min/max sizes
+        for part in parts[:-1]:
+            assert (1 << 6) <= len(part) <= (1 << 12)
+        assert len(parts[-1]) <= (1 << 12)
+        # deterministic: same data, same seed -> same cut points
+        parts2 = cf(ChunkerFastCDC(0, 6, 12, 9).chunkify(BytesIO(data)))
+        self.assert_equal(parts, parts2)
+        # a different seed gives different cut points
+        parts3 = cf(ChunkerFastCDC(1, 6, 12, 9).chunkify(BytesIO(data)))
+        assert parts != parts3
+        self.assert_equal(b"".join(parts3), data)
+        self.assert_equal(cf(ChunkerFastCDC(0, 6, 12, 9).chunkify(BytesIO(b""))), [])
+
+    def test_chunkify_shifted(self):
+        # content-defined chunking must resynchronize after an insertion at the start
+        data = pseudo_random_bytes(1 << 14)
+        parts = cf(ChunkerFastCDC(0, 6, 12, 9).chunkify(BytesIO(data)))
+        parts_shifted = cf(ChunkerFastCDC(0, 6, 12, 9).chunkify(BytesIO(b"X" * 42 + data)))
+        # only the first chunk is affected by the insertion, the cut points
+        # realign exactly from the second chunk on
+        self.assert_equal(parts[1:], parts_shifted[1:])
+
+    def test_small_reads(self):
+        class SmallReadFile:
+            input = b"a" * (20 + 1)
+
+            def read(self, nbytes):
+                self.input = self.input[:-1]
+                return self.input[:1]
+
+        chunker = get_chunker(CH_FASTCDC, CHUNK_MIN_EXP, CHUNK_MAX_EXP, HASH_MASK_BITS, seed=0)
+        reconstructed = b"".join(cf(chunker.chunkify(SmallReadFile())))
+        assert reconstructed == b"a" * 20
@@ -15,7 +15,7 @@ from ..archiver.prune_cmd import prune_within, prune_split
 from .. import platform
 from ..constants import MAX_DATA_SIZE
 from ..helpers import Location
-from ..helpers import Buffer
+from ..helpers import Buffer, BufferPool
 from ..helpers import (
     partial_format,
     format_file_size,
@@ -379,6 +379,8 @@ def test_format_timedelta():
         ("10,23,16,4095", ("buzhash", 10, 23, 16, 4095)),
         ("fixed,4096", ("fixed", 4096, 0)),
         ("fixed,4096,200", ("fixed", 4096, 200)),
+        ("fastcdc,19,23,21", ("fastcdc", 19, 23, 21)),
+        ("fastcdc,10,23,16", ("fastcdc", 10, 23, 16)),
     ],
 )
 def test_valid_chunkerparams(chunker_params, expected_return):
@@ -392,6 +394,9 @@ def test_valid_chunkerparams(chunker_params, expected_return):
         "buzhash,5,7,6,4095",  # too small min. size
         "buzhash,19,24,21,4095",  # too big max. size
         "buzhash,23,19,21,4095",  # violates min <= mask <= max
+        "fastcdc,5,23,21",  # too small min. size
+        "fastcdc,19,24,21",  # too big max. size
+        "fastcdc,19,23,19",  # violates min < mask < max
         "fixed,63",  # too small block size
         "fixed,%d,%d" % (MAX_DATA_SIZE + 1, 4096),  # too big block size
         "fixed,%d,%d" % (4096, MAX_DATA_SIZE + 1),  # too big header size
@@ -994,6 +999,33 @@ class TestBuffer:
         assert len(buffer) == 200
 
 
+class TestBufferPool:
+    def test_recycling(self):
+        pool = BufferPool(max_buffers=2)
+        b1 = pool.get(100)
+        assert isinstance(b1, bytearray) and len(b1) >= 100
+        pool.put(b1)
+        b2 = pool.get(50)
+        assert b2 is b1  # recycled, still big enough
+        pool.put(b2)
+        b3 = pool.get(200)
+        assert b3 is not b1  # was too small, got a new buffer
+
+    def test_max_buffers(self):
+        pool = BufferPool(max_buffers=1)
+        b1, b2 = pool.get(10), pool.get(10)
+        pool.put(b1)
+        pool.put(b2)  # pool is full, b2 is dropped
+        assert pool.get(10) is b1
+        assert pool.get(10) is not b2
+
+    def test_max_size(self):
+        pool = BufferPool(max_buffers=2, max_size=100)
+        b1 = pool.get(101)  # oversized buffers are handed out, but
+        pool.put(b1)  # not kept in the pool
+        assert pool.get(10) is not b1
+
+
 def test_yes_input():
     inputs = list(TRUISH)
     input = FakeInputs(inputs)
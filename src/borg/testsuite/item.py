@@ -1,8 +1,9 @@
 import pytest
 
+from ..archive import pack_default
 from ..cache import ChunkListEntry
-from ..item import Item, chunks_contents_equal
-from ..helpers import StableDict
+from ..item import ChunkList, Item, chunks_contents_equal
+from ..helpers import StableDict, msgpack
 from ..helpers.msgpack import Timestamp
 
 
@@ -120,6 +121,45 @@ def test_item_list_property():
     assert item.as_dict() == {"chunks": [0, 1]}
 
 
+def test_chunklist():
+    entries = [ChunkListEntry(bytes([i]) * 32, 100 + i) for i in range(10)]
+    cl = ChunkList(entries)
+    assert len(cl) == 10
+    assert list(cl) == entries
+    assert cl == entries
+    assert cl[0] == entries[0]
+    assert cl[-1] == entries[-1]
+    assert cl[2:4] == entries[2:4]
+    assert isinstance(cl[3], ChunkListEntry)
+    with pytest.raises(IndexError):
+        cl[10]
+    # tuple unpacking, as used all over the code
+    for (id, size), entry in zip(cl, entries):
+        assert id == entry.id
+        assert size == entry.size
+    assert ChunkList() == []
+    # ids must have the expected fixed length
+    with pytest.raises(ValueError):
+        ChunkList([ChunkListEntry(b"short-id", 42)])
+    # an Item accepts a ChunkList in place of a list of entries
+    item = Item(mode=0o100666)
+    item.chunks = cl
+    assert item.chunks is cl
+    assert item.get_size() == sum(e.size for e in entries)
+
+
+def test_chunklist_serialization():
+    # an Item carrying a ChunkList must serialize exactly like one carrying the plain entry list
+    entries = [ChunkListEntry(bytes([i]) * 32, 100 + i) for i in range(3)]
+    item = Item(mode=0o100666)
+    item.chunks = ChunkList(entries)
+    packed = msgpack.packb(item.as_dict(), default=pack_default)
+    item_plain = Item(mode=0o100666)
+    item_plain.chunks = list(entries)
+    assert packed == msgpack.packb(item_plain.as_dict())
+    assert msgpack.unpackb(packed)["chunks"] == [[e.id, e.size] for e in entries]
+
+
 def test_item_dict_property():
     item = Item()
     item.xattrs = StableDict()